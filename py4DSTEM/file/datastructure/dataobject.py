@@ -12,8 +12,10 @@
 #from ..log import Logger
 #logger = Logger()
 
+import sys
 import weakref
 from functools import wraps
+from collections import defaultdict
 
 # Decorator which enables more human-readable display of tracked dataobjects
 def show_object_list(method):
@@ -21,9 +23,9 @@ def show_object_list(method):
     def wrapper(*args, show=False, **kwargs):
         objectlist = method(*args, **kwargs)
         if show:
-            print("{:^8}{:^36}{:^20}".format('Index', 'Name', 'Type'))
-            for item in objectlist:
-                print("{:^8}{:<36s}{:<20}".format(item[0],item[1],item[2].__name__))
+            lines = ["{:^8}{:^36}{:^20}\n".format('Index', 'Name', 'Type')]
+            lines += ["{:^8}{:<36s}{:<20}\n".format(item[0],item[1],item[2].__name__) for item in objectlist]
+            sys.stdout.write("".join(lines))
             return
         else:
             return objectlist
@@ -91,33 +93,26 @@ class DataObject(object):
         Return a list of all dataobjects.
         """
         dataobjects = []
-        remove = []
-        for i in range(len(cls._instances)):
-            obj = cls._instances[i]()
+        live = []
+        for ref in cls._instances:
+            obj = ref()
             if obj is not None:
                 dataobjects.append(obj)
-            else:
-                remove.append(i)
-        for i in range(len(remove)):
-            del(cls._instances[remove[::-1][i]])
+                live.append(ref)
+        if len(live) != len(cls._instances):
+            cls._instances[:] = live
         return dataobjects
 
     @staticmethod
     @show_object_list
     def get_dataobject_list():
         """
-        Returns a list containing, for each dataobject, a list of its:
-            [index     name      objecttype      dataobject]
+        Returns a list containing, for each dataobject, a tuple of its:
+            (index     name      objecttype      dataobject)
         """
-        dataobjects = DataObject.get_dataobjects()
-        dataobject_list = []
-        for index in range(len(dataobjects)):
-            dataobject = dataobjects[index]
-            assert isinstance(dataobject, DataObject), "{} is not a DataObject instance".format(dataobject)
-            name = dataobject.name
-            objecttype = type(dataobject)
-            dataobject_list.append([index, name, objecttype, dataobject])
-        return dataobject_list
+        # Only DataObject.__init__ registers instances, so no type check is needed here
+        return [(index, dataobject.name, type(dataobject), dataobject)
+                for index,dataobject in enumerate(DataObject.get_dataobjects())]
 
     @staticmethod
     def show_dataobjects():
@@ -126,46 +121,43 @@ class DataObject(object):
     @staticmethod
     @show_object_list
     def sort_dataobjects_by_name():
-        dataobject_list = DataObject.get_dataobject_list()
-        return [item for item in dataobject_list if item[1]!=''] + \
-               [item for item in dataobject_list if item[1]=='']
+        named, unnamed = [], []
+        named_append, unnamed_append = named.append, unnamed.append
+        for item in DataObject.get_dataobject_list():
+            (named_append if item[1] else unnamed_append)(item)
+        return named + unnamed
 
     @staticmethod
     @show_object_list
     def sort_dataobjects_by_type(objecttype=None):
         dataobject_list = DataObject.get_dataobject_list()
         if objecttype is None:
-            types=[]
+            # dicts preserve insertion order, so types appear in first-seen order
+            buckets = defaultdict(list)
             for item in dataobject_list:
-                if item[2] not in types:
-                    types.append(item[2])
-            l=[]
-            for objecttype in types:
-                l += [item for item in dataobject_list if item[2]==objecttype]
+                buckets[item[2]].append(item)
+            l = [item for bucket in buckets.values() for item in bucket]
         else:
-            l = [item for item in dataobject_list if item[2]==objecttype]
+            l = [item for item in dataobject_list if item[2] is objecttype]
         return l
 
     @staticmethod
     @show_object_list
     def get_dataobject_by_name(name, exactmatch=False):
-        dataobject_list = DataObject.get_dataobject_list()
+        dataobjects = DataObject.get_dataobjects()
         if exactmatch:
-            return [item[3] for item in dataobject_list if name == item[1]]
+            return [dataobject for dataobject in dataobjects if name == dataobject.name]
         else:
-            return [item[3] for item in dataobject_list if name in item[1]]
+            return [dataobject for dataobject in dataobjects if name in dataobject.name]
 
     @staticmethod
-    @show_object_list
     def get_dataobject_by_index(index):
-        dataobject_list = DataObject.get_dataobject_list()
-        return dataobject_list[index][3]
+        return DataObject.get_dataobjects()[index]
 
     @staticmethod
     @show_object_list
     def get_dataobject_by_type(objecttype):
-        dataobject_list = DataObject.get_dataobject_list()
-        return [item[3] for item in dataobject_list if isinstance(item[3], objecttype)]
+        return [dataobject for dataobject in DataObject.get_dataobjects() if isinstance(dataobject, objecttype)]
 
 
 
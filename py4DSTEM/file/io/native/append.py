@@ -22,7 +22,7 @@ def append_from_dataobject_list(fp, dataobject_list, topgroup='4DSTEM_experiment
         topgroup            name of the h5 toplevel group containing the py4DSTEM file of interest
     """
 
-    assert all([isinstance(item,DataObject) for item in dataobject_list]), "Error: all elements of dataobject_list must be DataObject instances."
+    assert all(isinstance(item,DataObject) for item in dataobject_list), "Error: all elements of dataobject_list must be DataObject instances."
     assert(is_py4DSTEM_file(fp)), "Error: file is not recognized as a py4DSTEM file."
     tgs = get_py4DSTEM_topgroups(fp)
     assert(topgroup in tgs), "Error: specified topgroup, {}, not found.".format(self.topgroup)
@@ -152,9 +152,9 @@ def append(fp, data, **kwargs):
     elif isinstance(data, int):
         append_dataobjects_by_indices(fp, [data], **kwargs)
     elif isinstance(data, list):
-        if all([isinstance(item,DataObject) for item in data]):
+        if all(isinstance(item,DataObject) for item in data):
             append_from_dataobject_list(fp, data, **kwargs)
-        elif all([isinstance(item,int) for item in data]):
+        elif all(isinstance(item,int) for item in data):
             append_dataobjects_by_indices(fp, data, **kwargs)
         else:
             print("Error: if data is a list, it must contain all ints or all DataObjects.")
@@ -42,7 +42,7 @@ def copy(fp_orig, fp_new, topgroup='4DSTEM_experiment', **kwargs):
     else:
         if isinstance(indices, int):
             indices = [indices]
-        assert(all([isinstance(item,(int,np.integer)) for item in indices])), "Error: indices must be ints."
+        assert(all(isinstance(item,(int,np.integer)) for item in indices)), "Error: indices must be ints."
 
     info = get_py4DSTEM_dataobject_info(fp_orig,topgroup)
     for i in indices:
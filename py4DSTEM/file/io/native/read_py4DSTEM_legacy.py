@@ -60,7 +60,7 @@ def read_py4DSTEM_legacy(fp, **kwargs):
 
     # For HDF5 files containing multiple valid EMD type 2 files, disambiguate desired data
     tgs = get_py4DSTEM_topgroups(fp)
-    if 'topgroup' in kwargs.keys():
+    if 'topgroup' in kwargs:
         tg = kwargs['topgroup']
         assert(self.topgroup in topgroups), "Error: specified topgroup, {}, not found.".format(self.topgroup)
     else:
@@ -75,16 +75,16 @@ def read_py4DSTEM_legacy(fp, **kwargs):
             return None,None
 
     # Triage - determine what needs doing
-    _data_id = 'data_id' in kwargs.keys()
-    _metadata = 'metadata' in kwargs.keys()
-    _log = 'log' in kwargs.keys()
+    _data_id = 'data_id' in kwargs
+    _metadata = 'metadata' in kwargs
+    _log = 'log' in kwargs
 
     # Validate inputs
     if _data_id:
         data_id = kwargs['data_id']
         assert(isinstance(data_id,(int,str,list,tuple))), "Error: data must be specified with strings or integers only."
         if not isinstance(data_id,(int,str)):
-            assert(all([isinstance(d,(int,str)) for d in data_id])), "Error: data must be specified with strings or integers only."
+            assert(all(isinstance(d,(int,str)) for d in data_id)), "Error: data must be specified with strings or integers only."
     if _metadata:
         assert(isinstance(kwargs.keys['metdata'],bool))
         _metadata = kwargs.keys['metadata']
@@ -93,17 +93,17 @@ def read_py4DSTEM_legacy(fp, **kwargs):
         _log = kwargs.keys['log']
 
     # Parse optional arguments
-    if 'mem' in kwargs.keys():
+    if 'mem' in kwargs:
         mem = kwargs['mem']
         assert(mem in ('RAM','MEMMAP'))
     else:
         mem='RAM'
-    if 'binfactor' in kwargs.keys():
+    if 'binfactor' in kwargs:
         binfactor = kwargs['binfactor']
         assert(isinstance(binfactor,int))
     else:
         binfactor=1
-    if 'dtype' in kwargs.keys():
+    if 'dtype' in kwargs:
         bindtype = kwargs['dtype']
         assert(isinstance(bindtype,type))
     else:
@@ -217,7 +217,7 @@ def get_data_from_list(fp,tg,data_id,mem='RAM',binfactor=1,bindtype=None):
     """ Accepts a fp to a valid py4DSTEM file and a list or tuple specifying data, and returns the data.
     """
     assert(isinstance(data_id,(list,tuple)))
-    assert(all([isinstance(d,(int,str)) for d in data_id]))
+    assert(all(isinstance(d,(int,str)) for d in data_id))
     data = []
     for el in data_id:
         if isinstance(el,int):
@@ -14,7 +14,7 @@ def remove_from_index_list(fp, indices, topgroup='4DSTEM_experiment'):
         fp            path to the py4DSTEM .h5 file
         indices             (list of ints) the indices of the DataObjects to remove
     """
-    assert(all([isinstance(item,(int,np.integer)) for item in indices])), "Error: indices must be ints."
+    assert(all(isinstance(item,(int,np.integer)) for item in indices)), "Error: indices must be ints."
     assert is_py4DSTEM_file(fp), "fp parameter must point to an existing py4DSTEM file."
     tgs = get_py4DSTEM_topgroups(fp)
     assert(topgroup in tgs), "Error: topgroup '{}' not found.".format(topgroup)
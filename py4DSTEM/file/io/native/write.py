@@ -22,7 +22,7 @@ def save_from_dataobject_list(fp, dataobject_list, topgroup="4DSTEM_experiment",
         topgroup            (str) name for the toplevel group; if None, use "4DSTEM_experiment"
     """
 
-    assert(all([isinstance(item,DataObject) for item in dataobject_list])), "Error: all elements of dataobject_list must be DataObject instances."
+    assert(all(isinstance(item,DataObject) for item in dataobject_list)), "Error: all elements of dataobject_list must be DataObject instances."
     assert(isinstance(topgroup,str)), "Error: topgroup must be a string"
     if exists(fp):
         if overwrite is False:
@@ -162,9 +162,9 @@ def save(fp, data, **kwargs):
     elif isinstance(data, int):
         save_dataobjects_by_indices(fp, [data], **kwargs)
     elif isinstance(data, list):
-        if all([isinstance(item,DataObject) for item in data]):
+        if all(isinstance(item,DataObject) for item in data):
             save_from_dataobject_list(fp, data, **kwargs)
-        elif all([isinstance(item,int) for item in data]):
+        elif all(isinstance(item,int) for item in data):
             save_dataobjects_by_indices(fp, data, **kwargs)
         else:
             print("Error: if data is a list, it must contain all ints or all DataObjects.")
@@ -40,10 +40,7 @@ def read_dm(fp, mem="RAM", binfactor=1, **kwargs):
         with dm.fileDM(fp, on_memory=False) as dmFile:
             memmap = dmFile.getMemmap(0)
             md = None # TODO
-        if 'dtype' in kwargs.keys():
-            dtype = kwargs['dtype']
-        else:
-            dtype = memmap.dtype
+        dtype = kwargs.get('dtype',memmap.dtype)
         R_Nx,R_Ny,Q_Nx,Q_Ny = memmap.shape
         Q_Nx, Q_Ny = Q_Nx//binfactor, Q_Ny//binfactor
         data = np.empty((R_Nx,R_Ny,Q_Nx,Q_Ny),dtype=dtype)
@@ -24,14 +24,14 @@ class Logger(object):
     class __Logger(object):
         def __init__(self):
             self.log_index = 0
-            self.logged_items = OrderedDict()
+            self.logged_items = []
 
         def add_item(self, function, inputs, version, datetime):
             log_item = LogItem(function=function,
                                inputs=inputs,
                                version=version,
                                datetime=datetime)
-            self.logged_items[self.log_index] = log_item
+            self.logged_items.append(log_item)
             self.log_index += 1
 
         def show_item(self, index):
@@ -68,6 +68,7 @@ class Logger(object):
         return setattr(self.instance,name)
 
 class LogItem(object):
+    __slots__ = ('function','inputs','version','datetime')
 
     def __init__(self, function, inputs, version, datetime):
         self.function = function
@@ -79,8 +80,6 @@ logger = Logger()
 
 def log(function):
 
-    global logger
-
     # Get the parameters and default arguments
     signature = inspect.signature(function)
     inputs = OrderedDict()
@@ -89,13 +88,13 @@ def log(function):
             inputs[key] = None
         else:
             inputs[key] = value.default
+    keys = list(inputs.keys())
 
     # Define the new function
     @wraps(function)
     def logged_function(*args,**kwargs):
-        for i in range(len(args)):
-            key = list(inputs.items())[i][0]
-            inputs[key] = args[i]
+        for key,arg in zip(keys,args):
+            inputs[key] = arg
         for key,value in kwargs.items():
             inputs[key] = value
 
@@ -77,10 +77,7 @@ class KinematicLibrary:
 
 		# if no poles are given, use the cubic structure's symmetric wedge:
 		if poles is None:
-			if 'n_poles' in kwargs.keys():
-				n = kwargs['n_poles']
-			else:
-				n = 250 # ROUGHLY this many poles
+			n = kwargs.get('n_poles',250) # ROUGHLY this many poles
 			self.poles =self._cubic_poles(n)
 		else:
 			self.poles = poles